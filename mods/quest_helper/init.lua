@@ -3526,5 +3526,118 @@ minetest.register_on_leaveplayer(function(player)
     placement_mode[name] = nil
 end)
 
+-- ============================================
+-- SERVER STEP TIMING
+-- Track server step times so tools/load-test.py can correlate
+-- command latency with server load
+-- ============================================
+
+-- Number of recent steps kept for statistics (~60 seconds at 0.05s steps)
+local STEPTIME_WINDOW = 1200
+
+-- Configured step target (Luanti default is 0.09 when not set)
+local STEPTIME_TARGET = tonumber(minetest.settings:get("dedicated_server_step")) or 0.09
+
+-- A step counts as "slow" when it takes longer than this multiple of the target
+local STEPTIME_SLOW_FACTOR = 2
+
+local step_samples = {}   -- Ring buffer of recent step durations (seconds)
+local step_index = 0
+local step_total = 0      -- Steps seen since last reset
+local step_slow = 0       -- Slow steps seen since last reset
+local step_max = 0        -- Longest step since last reset
+
+-- Per-interval statistics, cleared by each "/steptime interval" call
+local interval_samples = {}
+local interval_total = 0
+local interval_slow = 0
+local interval_max = 0
+
+local function reset_interval_stats()
+    interval_samples = {}
+    interval_total = 0
+    interval_slow = 0
+    interval_max = 0
+end
+
+local function reset_step_stats()
+    step_samples = {}
+    step_index = 0
+    step_total = 0
+    step_slow = 0
+    step_max = 0
+    reset_interval_stats()
+end
+
+minetest.register_globalstep(function(dtime)
+    local slow = dtime > STEPTIME_TARGET * STEPTIME_SLOW_FACTOR
+
+    step_index = step_index % STEPTIME_WINDOW + 1
+    step_samples[step_index] = dtime
+    step_total = step_total + 1
+    if slow then
+        step_slow = step_slow + 1
+    end
+    if dtime > step_max then
+        step_max = dtime
+    end
+
+    -- Interval buffer is capped at the same window size
+    interval_samples[interval_total % STEPTIME_WINDOW + 1] = dtime
+    interval_total = interval_total + 1
+    if slow then
+        interval_slow = interval_slow + 1
+    end
+    if dtime > interval_max then
+        interval_max = dtime
+    end
+end)
+
+-- Format step statistics as a key=value line for tools/load-test.py
+local function format_step_stats(label, samples, max, slow, total)
+    local count = #samples
+    if count == 0 then
+        return string.format("%s target=%.3f samples=0 total=%d", label, STEPTIME_TARGET, total)
+    end
+
+    local sorted = {}
+    local sum = 0
+    for i = 1, count do
+        sorted[i] = samples[i]
+        sum = sum + samples[i]
+    end
+    table.sort(sorted)
+    local p95 = sorted[math.max(1, math.ceil(count * 0.95))]
+
+    return string.format(
+        "%s target=%.3f samples=%d avg=%.4f p95=%.4f max=%.4f slow=%d total=%d",
+        label, STEPTIME_TARGET, count, sum / count, p95, max, slow, total)
+end
+
+-- /steptime - Report server step statistics in key=value form
+minetest.register_chatcommand("steptime", {
+    params = "[reset|interval]",
+    description = "Show server step time statistics (avg/p95 over recent steps, max/slow since reset). 'interval' reports and clears stats since the last interval call, 'reset' clears everything",
+    privs = {server = true},
+    func = function(name, param)
+        local mode = param:match("^%s*(%S*)%s*$")
+        mode = mode and mode:lower()
+
+        if mode == "reset" then
+            reset_step_stats()
+            return true, "Step time statistics reset"
+        elseif mode == "interval" then
+            local result = format_step_stats("steptime interval", interval_samples,
+                interval_max, interval_slow, interval_total)
+            reset_interval_stats()
+            return true, result
+        elseif mode ~= "" then
+            return false, "Usage: /steptime [reset|interval]"
+        end
+
+        return true, format_step_stats("steptime", step_samples, step_max, step_slow, step_total)
+    end,
+})
+
 -- Print loaded message
-minetest.log("action", "[quest_helper] Quest Helper mod loaded! Commands: /starterkit, /herokit, /questkit, /treasure, /puzzlechest, /savespot, /gospot, /bringall, /announce, /countdown, /placetext, /bigtext, /placemarker, /trail, /pole, /beacon, /vanish, /leaderboard, /myscore, /hud, /resetscores, /chestmode, /reloadquestions, /questionstats, /resetquestions, /scatter")
+minetest.log("action", "[quest_helper] Quest Helper mod loaded! Commands: /starterkit, /herokit, /questkit, /treasure, /puzzlechest, /savespot, /gospot, /bringall, /announce, /countdown, /placetext, /bigtext, /placemarker, /trail, /pole, /beacon, /vanish, /leaderboard, /myscore, /hud, /resetscores, /chestmode, /reloadquestions, /questionstats, /resetquestions, /scatter, /steptime")
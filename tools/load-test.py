@@ -0,0 +1,702 @@
+#!/usr/bin/env python3
+"""
+Luanti Load Test Tool
+Replays a mix of quest_helper chat commands through the MTUI API at a target
+rate, records latency histograms and error rates, and samples server step
+time via /steptime to see how close the server gets to its step budget.
+
+Usage:
+    ./load-test.py --mtuiurl=http://192.168.1.223:8000 --password=secret --rate=5 --duration=60
+    ./load-test.py --mtuiurl=... --password=... --mix=puzzlechest=3,leaderboard=10,placetext=2
+    ./load-test.py --fake --rate=20 --duration=30
+    ./load-test.py --serve-fake --port=8000
+
+--fake runs against a built-in fake MTUI (no game server needed), useful for
+offline regression runs of the tool itself.
+"""
+
+import argparse
+import http.client
+import http.cookiejar
+import json
+import logging
+import math
+import queue
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+
+# Default paths
+DEFAULT_QUESTIONS_DB = Path(__file__).parent / "questions.json"
+
+# Default command mix (command=weight)
+DEFAULT_MIX = "puzzlechest=3,leaderboard=10"
+
+# Commands the mod refuses unless the admin is online in-game
+PLAYER_COMMANDS = ["placetext", "scatter"]
+
+# Latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Simulated main-thread cost per command for the fake MTUI (seconds)
+FAKE_COMMAND_COST = {
+    "puzzlechest": 0.004,
+    "scatter": 0.030,
+    "leaderboard": 0.001,
+    "placetext": 0.003,
+    "steptime": 0.0005,
+}
+
+TIERS = ["small", "medium", "big", "epic"]
+
+
+def setup_logging(verbose: bool = False):
+    """Setup console logging."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+
+class MtuiClient:
+    """Minimal MTUI API client (same endpoints as luanti-cli.sh)."""
+
+    def __init__(self, mtui_url: str, user: str, password: str, timeout: float = 30):
+        self.mtui_url = mtui_url.rstrip("/")
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def _post(self, path: str, payload: Dict) -> Dict:
+        request = urllib.request.Request(
+            self.mtui_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with self.opener.open(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8") or "{}")
+
+    def login(self) -> bool:
+        """Log in and keep the session cookie."""
+        try:
+            response = self._post("/api/login", {"username": self.user, "password": self.password})
+        except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError) as e:
+            logging.error(f"Login failed: {e}")
+            return False
+
+        if "username" not in response:
+            logging.error(f"Login failed: {response}")
+            return False
+        return True
+
+    def execute(self, command: str) -> Tuple[bool, str]:
+        """
+        Execute a chat command.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            response = self._post("/api/bridge/execute_chatcommand",
+                                  {"command": command.lstrip("/")})
+        except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError) as e:
+            return False, str(e)
+        return bool(response.get("success")), str(response.get("message", ""))
+
+
+class CommandMix:
+    """Weighted mix of quest_helper commands to replay."""
+
+    def __init__(self, spec: str, questions_db: Path, origin: Tuple[int, int], spread: int):
+        self.weights = self.parse_spec(spec)
+        self.origin = origin
+        self.spread = spread
+        self.questions = self._load_questions(questions_db)
+        self.counter = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def parse_spec(spec: str) -> Dict[str, float]:
+        """Parse 'puzzlechest=3,leaderboard=10' into a weight dict."""
+        weights = {}
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            name, _, weight = part.partition("=")
+            name = name.strip().lstrip("/")
+            if name not in FAKE_COMMAND_COST or name == "steptime":
+                raise ValueError(f"Unsupported command in mix: {name}")
+            weights[name] = float(weight) if weight else 1.0
+        if not weights or sum(weights.values()) <= 0:
+            raise ValueError(f"Empty command mix: {spec}")
+        return weights
+
+    def _load_questions(self, db_path: Path) -> List[Dict]:
+        """Load all questions from the JSON database (falls back to a fixed question)."""
+        try:
+            with open(db_path, 'r') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            logging.warning(f"Could not load questions from {db_path}: {e}")
+            return [{"q": "What is 2+2?", "a": "4|four"}]
+        questions = []
+        for difficulty in ["easy", "medium", "hard", "expert"]:
+            questions.extend(data.get(difficulty, []))
+        return questions or [{"q": "What is 2+2?", "a": "4|four"}]
+
+    def _random_pos(self) -> Tuple[int, int]:
+        x = self.origin[0] + random.randint(-self.spread, self.spread)
+        z = self.origin[1] + random.randint(-self.spread, self.spread)
+        return x, z
+
+    def next_command(self) -> Tuple[str, str]:
+        """Pick the next command. Returns (command name, full /command)."""
+        with self.lock:
+            self.counter += 1
+            seq = self.counter
+        name = random.choices(list(self.weights), weights=list(self.weights.values()))[0]
+
+        if name == "puzzlechest":
+            x, z = self._random_pos()
+            question = random.choice(self.questions)
+            return name, f"/puzzlechest {x} ~ {z} {random.choice(TIERS)} {question['q']} | {question['a']}"
+        elif name == "placetext":
+            x, z = self._random_pos()
+            return name, f"/placetext {x} ~ {z} Load test #{seq}"
+        elif name == "scatter":
+            return name, f"/scatter {min(200, max(10, self.spread))} 3"
+        return name, "/leaderboard"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram that also keeps raw samples for percentiles."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples: List[float] = []
+        self.errors = 0
+
+    def record(self, latency: float, success: bool):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.samples.append(latency)
+        if not success:
+            self.errors += 1
+
+    @property
+    def total(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(len(ordered) * pct / 100) - 1)]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.total,
+            "errors": self.errors,
+            "error_rate": self.errors / self.total if self.total else 0.0,
+            "mean": statistics.fmean(self.samples) if self.samples else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self.samples) if self.samples else 0.0,
+            "buckets": {
+                (f"<={bound}" if i < len(LATENCY_BUCKETS) else f">{LATENCY_BUCKETS[-1]}"): count
+                for i, (bound, count) in enumerate(zip(LATENCY_BUCKETS + [None], self.counts))
+            },
+        }
+
+
+def parse_steptime(message: str) -> Optional[Dict[str, float]]:
+    """Parse the key=value reply of /steptime (values that are not numbers are skipped)."""
+    if "steptime" not in message:
+        return None
+    return {key: float(value) for key, value in re.findall(r"(\w+)=(-?\d+(?:\.\d+)?)\b", message)}
+
+
+class LoadTester:
+    """Drives the command mix at a fixed rate and collects statistics."""
+
+    def __init__(self, client_factory, mix: CommandMix, rate: float, duration: float,
+                 workers: int, step_interval: float):
+        self.client_factory = client_factory
+        self.mix = mix
+        self.rate = rate
+        self.duration = duration
+        self.workers = workers
+        self.step_interval = step_interval
+
+        self.jobs: "queue.Queue[Optional[Tuple[float, str, str]]]" = queue.Queue()
+        self.lock = threading.Lock()
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.window = LatencyHistogram()
+        self.intervals: List[Dict[str, Any]] = []
+        self.max_queue_lag = 0.0
+        self.last_sample = 0.0
+        self.stop_event = threading.Event()
+
+    def _record(self, name: str, latency: float, success: bool):
+        with self.lock:
+            self.histograms.setdefault(name, LatencyHistogram()).record(latency, success)
+            self.window.record(latency, success)
+
+    def _worker(self):
+        client = self.client_factory()
+        if not client.login():
+            self.stop_event.set()
+            return
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            scheduled, name, command = job
+            started = time.monotonic()
+            try:
+                success, message = client.execute(command)
+            except Exception as e:
+                # Never lose a session silently; count the command as failed
+                success, message = False, f"{type(e).__name__}: {e}"
+            # Latency counts from the scheduled send time so queueing behind a
+            # slow server shows up instead of silently lowering the rate
+            latency = time.monotonic() - scheduled
+            with self.lock:
+                self.max_queue_lag = max(self.max_queue_lag, started - scheduled)
+            if not success:
+                logging.debug(f"{command[:60]} -> FAILED: {message}")
+            self._record(name, latency, success)
+
+    def _sample_steptime(self, client: MtuiClient, elapsed: float):
+        # "interval" reports and clears step stats since the previous sample,
+        # so each row covers the same time span as its command window
+        success, message = client.execute("/steptime interval")
+        step = parse_steptime(message) if success else None
+        if step is None:
+            logging.warning(f"/steptime unavailable: {message}")
+        with self.lock:
+            window, self.window = self.window, LatencyHistogram()
+        span, self.last_sample = elapsed - self.last_sample, elapsed
+        self.intervals.append({
+            "elapsed": round(elapsed, 1),
+            "commands": window.total,
+            "rate": window.total / span if span > 0 else 0.0,
+            "errors": window.errors,
+            "latency_p95": window.percentile(95),
+            "step": step or {},
+        })
+
+    def _step_monitor(self, start: float):
+        client = self.client_factory()
+        if not client.login():
+            return
+        client.execute("/steptime reset")
+        while not self.stop_event.wait(self.step_interval):
+            self._sample_steptime(client, time.monotonic() - start)
+        self._sample_steptime(client, time.monotonic() - start)
+
+    def run(self) -> Dict[str, Any]:
+        start = time.monotonic()
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+        for t in threads:
+            t.start()
+        monitor = threading.Thread(target=self._step_monitor, args=(start,), daemon=True)
+        monitor.start()
+
+        # Open-loop schedule: commands are queued at the target rate regardless
+        # of how fast the server answers
+        sent = 0
+        interval = 1.0 / self.rate
+        while not self.stop_event.is_set():
+            scheduled = start + sent * interval
+            if scheduled - start >= self.duration:
+                break
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            name, command = self.mix.next_command()
+            self.jobs.put((scheduled, name, command))
+            sent += 1
+
+        for _ in threads:
+            self.jobs.put(None)
+        for t in threads:
+            t.join()
+        self.stop_event.set()
+        monitor.join()
+
+        return self._report(sent, time.monotonic() - start)
+
+    def _report(self, sent: int, elapsed: float) -> Dict[str, Any]:
+        overall = LatencyHistogram()
+        for hist in self.histograms.values():
+            for latency in hist.samples:
+                overall.record(latency, True)
+            overall.errors += hist.errors
+
+        # Correlate per-interval command latency with server step time
+        pairs = [(i["latency_p95"], i["step"]["p95"]) for i in self.intervals
+                 if i["commands"] and "p95" in i["step"]]
+        correlation = None
+        if len(pairs) >= 3:
+            try:
+                correlation = statistics.correlation(*zip(*pairs))
+            except statistics.StatisticsError:
+                correlation = None
+
+        return {
+            "target_rate": self.rate,
+            "sent": sent,
+            "elapsed": elapsed,
+            "achieved_rate": overall.total / elapsed if elapsed else 0.0,
+            "max_queue_lag": self.max_queue_lag,
+            "overall": overall.summary(),
+            "commands": {name: hist.summary() for name, hist in sorted(self.histograms.items())},
+            "intervals": self.intervals,
+            "latency_step_correlation": correlation,
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a human-readable summary of the run."""
+    overall = report["overall"]
+    print(f"\n=== Load test: {report['sent']} commands in {report['elapsed']:.1f}s "
+          f"(target {report['target_rate']}/s, achieved {report['achieved_rate']:.2f}/s) ===")
+    print(f"Errors: {overall['errors']} ({overall['error_rate'] * 100:.1f}%)   "
+          f"Max queue lag: {report['max_queue_lag'] * 1000:.0f}ms")
+
+    print(f"\n{'command':<12} {'count':>6} {'err%':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'maxms':>8}")
+    for name, s in list(report["commands"].items()) + [("ALL", overall)]:
+        print(f"{name:<12} {s['count']:>6} {s['error_rate'] * 100:>6.1f} {s['p50'] * 1000:>8.1f} "
+              f"{s['p95'] * 1000:>8.1f} {s['p99'] * 1000:>8.1f} {s['max'] * 1000:>8.1f}")
+
+    print("\nLatency histogram (all commands):")
+    peak = max(overall["buckets"].values()) or 1
+    for label, count in overall["buckets"].items():
+        print(f"  {label:>8}s {count:>6} {'#' * round(40 * count / peak)}")
+
+    if report["intervals"]:
+        print("\nPer interval (each row covers the time since the previous row):")
+        print(f"{'t(s)':>6} {'cmd/s':>6} {'err':>4} {'p95ms':>8} {'step_avg':>9} {'step_p95':>9} {'step_max':>9} {'slow':>5}")
+        for i in report["intervals"]:
+            step = i["step"]
+            print(f"{i['elapsed']:>6} {i['rate']:>6.1f} {i['errors']:>4} {i['latency_p95'] * 1000:>8.1f} "
+                  f"{step.get('avg', 0):>9.4f} {step.get('p95', 0):>9.4f} "
+                  f"{step.get('max', 0):>9.4f} {int(step.get('slow', 0)):>5}")
+        target = report["intervals"][-1]["step"].get("target")
+        if target:
+            print(f"Step target (dedicated_server_step): {target:.3f}s")
+
+    if report["latency_step_correlation"] is not None:
+        print(f"Correlation (per-interval command p95 latency vs step p95): {report['latency_step_correlation']:.2f}")
+
+
+class FakeMtui:
+    """
+    Local stand-in for MTUI + quest_helper used for offline runs.
+
+    Commands are executed one at a time under a lock, like the single-threaded
+    Luanti main loop, so queueing and step time grow realistically with load.
+    """
+
+    def __init__(self, user: str, password: str, step_target: float = 0.05,
+                 error_rate: float = 0.0, port: int = 0, admin_online: bool = False):
+        self.user = user
+        self.password = password
+        self.step_target = step_target
+        self.error_rate = error_rate
+        self.admin_online = admin_online
+        self.main_loop = threading.Lock()
+        self.busy: deque = deque()   # (finish time, busy seconds)
+        self.reset_time = time.monotonic()
+        self.interval_time = self.reset_time
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _steps(self, since: float) -> List[float]:
+        """Simulated step durations since the given time (at most 60 seconds)."""
+        now = time.monotonic()
+        start = max(since, now - 60)
+        slots = max(1, int((now - start) / self.step_target))
+        steps = [self.step_target] * slots
+        for finished, cost in self.busy:
+            index = int((finished - start) / self.step_target)
+            if 0 <= index < slots:
+                steps[index] += cost
+        return steps
+
+    def steptime(self, param: str) -> Tuple[bool, str]:
+        label = "steptime"
+        if param == "reset":
+            self.busy.clear()
+            self.reset_time = self.interval_time = time.monotonic()
+            return True, "Step time statistics reset"
+        elif param == "interval":
+            label = "steptime interval"
+            steps = self._steps(self.interval_time)
+            self.interval_time = time.monotonic()
+        elif param == "":
+            steps = self._steps(self.reset_time)
+        else:
+            return False, "Usage: /steptime [reset|interval]"
+        ordered = sorted(steps)
+        slow = sum(1 for s in steps if s > self.step_target * 2)
+        return True, (f"{label} target={self.step_target:.3f} samples={len(steps)} "
+                f"avg={statistics.fmean(steps):.4f} p95={ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]:.4f} "
+                f"max={ordered[-1]:.4f} slow={slow} total={len(steps)}")
+
+    def check_params(self, name: str, param: str) -> Optional[str]:
+        """Mirror the quest_helper checks that reject a command. Returns an error or None."""
+        if name in PLAYER_COMMANDS and not self.admin_online:
+            return "Player not found"
+        if name == "puzzlechest":
+            match = re.match(r"^(-?\d+\.?\d*)\s+([~g-]?\d*\.?\d*)\s+(-?\d+\.?\d*)\s+(\w+)\s+(.+)$", param)
+            if match:
+                tier, qa_text = match.group(4), match.group(5)
+            elif self.admin_online and re.match(r"^\w+\s+.+$", param):
+                tier, _, qa_text = param.partition(" ")
+            else:
+                return "Coordinates required when not in-game"
+            if tier.lower() not in TIERS:
+                return "Invalid tier. Use: small, medium, big, or epic"
+            question, sep, answer = qa_text.partition("|")
+            if not sep or not question.strip() or not answer.strip():
+                return "Please separate question and answer with |"
+        elif name == "placetext":
+            if not param.strip():
+                return "Please provide text for the sign"
+        elif name == "scatter":
+            match = re.match(r"^(\d+)\s+(\d+)\s*(\w*)$", param)
+            if not match:
+                return "Usage: /scatter <radius> <count> [exposed]"
+            if not 10 <= int(match.group(1)) <= 200:
+                return "Radius must be between 10 and 200 blocks"
+            if int(match.group(2)) < 1:
+                return "Count must be at least 1"
+        return None
+
+    def execute(self, command: str) -> Tuple[bool, str]:
+        name, _, param = command.partition(" ")
+        cost = FAKE_COMMAND_COST.get(name)
+        if cost is None:
+            return False, f"Invalid command: {name}"
+        error = self.check_params(name, param)
+        if error:
+            return False, error
+        with self.main_loop:
+            busy = cost * random.uniform(0.5, 1.5)
+            time.sleep(busy)
+            self.busy.append((time.monotonic(), busy))
+            while self.busy and self.busy[0][0] < time.monotonic() - 60:
+                self.busy.popleft()
+            if name == "steptime":
+                return self.steptime(param.strip().lower())
+        if random.random() < self.error_rate:
+            return False, "Simulated failure"
+        return True, f"{name} ok"
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logging.debug("fake mtui: " + format % args)
+
+            def _reply(self, status: int, payload: Dict):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if payload.get("username"):
+                    self.send_header("Set-Cookie", "mtui_session=fake; Path=/")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    data = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    return self._reply(400, {"message": "Invalid JSON"})
+
+                if self.path == "/api/login":
+                    if data.get("username") == fake.user and data.get("password") == fake.password:
+                        return self._reply(200, {"username": fake.user})
+                    return self._reply(401, {"message": "Invalid credentials"})
+
+                if self.path == "/api/bridge/execute_chatcommand":
+                    if "mtui_session=fake" not in self.headers.get("Cookie", ""):
+                        return self._reply(401, {"message": "Not logged in"})
+                    success, message = fake.execute(str(data.get("command", "")))
+                    return self._reply(200, {"success": success, "message": message})
+
+                self._reply(404, {"message": "Not found"})
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Luanti Load Test Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # 5 commands/s for 60 seconds with the default mix
+  %(prog)s --mtuiurl=http://192.168.1.223:8000 --password=secret --rate=5 --duration=60
+
+  # Custom mix (command=weight), chests placed around x=500 z=500
+  %(prog)s --mtuiurl=... --password=... --mix=puzzlechest=5,leaderboard=10 --origin=500,500
+
+  # Offline run against the built-in fake MTUI, fail if >1%% errors
+  %(prog)s --fake --rate=20 --duration=30 --max-error-rate=0.01
+
+  # Run only the fake MTUI (e.g. for luanti-cli.sh)
+  %(prog)s --serve-fake --port=8000 --password=secret
+
+Supported mix commands: puzzlechest, scatter, leaderboard, placetext
+(default: {DEFAULT_MIX}). Use a test world: puzzle chests and signs placed
+by the run are real. /placetext and /scatter fail unless the admin is
+online in-game, so they are not in the default mix.
+"""
+    )
+
+    parser.add_argument("--mtuiurl", default=None,
+                        help="MTUI URL (e.g., http://192.168.1.223:8000)")
+    parser.add_argument("--user", default="admin",
+                        help="Admin username for MTUI (default: admin)")
+    parser.add_argument("--password", default=None,
+                        help="Admin password for MTUI")
+
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Command mix as command=weight list (default: {DEFAULT_MIX})")
+    parser.add_argument("--rate", type=float, default=5.0,
+                        help="Target commands per second (default: 5)")
+    parser.add_argument("--duration", type=float, default=60.0,
+                        help="Test duration in seconds (default: 60)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Concurrent MTUI sessions (default: 8)")
+    parser.add_argument("--stepinterval", type=float, default=5.0,
+                        help="Seconds between /steptime samples (default: 5)")
+    parser.add_argument("--origin", default="0,0",
+                        help="x,z center for placed chests and signs (default: 0,0)")
+    parser.add_argument("--spread", type=int, default=50,
+                        help="Placement radius around origin, also /scatter radius (default: 50)")
+    parser.add_argument("--questionsdb", type=Path, default=DEFAULT_QUESTIONS_DB,
+                        help=f"Path to questions database (default: {DEFAULT_QUESTIONS_DB})")
+    parser.add_argument("--report", type=Path, default=None,
+                        help="Write the full report as JSON to this file")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Exit with status 1 if the error rate exceeds this fraction")
+
+    # Fake MTUI
+    parser.add_argument("--fake", action="store_true",
+                        help="Run against a built-in fake MTUI instead of a real server")
+    parser.add_argument("--serve-fake", action="store_true",
+                        help="Only run the fake MTUI until interrupted")
+    parser.add_argument("--port", type=int, default=0,
+                        help="Port for the fake MTUI (default: random free port)")
+    parser.add_argument("--fake-step", type=float, default=0.05,
+                        help="Simulated dedicated_server_step for the fake MTUI (default: 0.05)")
+    parser.add_argument("--fake-admin-online", action="store_true",
+                        help="Fake an in-game admin so /placetext and /scatter succeed (default: off)")
+    parser.add_argument("--fake-error-rate", type=float, default=0.0,
+                        help="Fraction of fake commands that fail (default: 0)")
+
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Verbose output")
+
+    args = parser.parse_args()
+    setup_logging(args.verbose)
+
+    if args.rate <= 0 or args.duration <= 0 or args.workers < 1 or args.stepinterval <= 0:
+        parser.error("--rate, --duration, --stepinterval must be positive and --workers at least 1")
+
+    try:
+        origin_x, origin_z = (int(v) for v in args.origin.split(","))
+        mix = CommandMix(args.mix, args.questionsdb, (origin_x, origin_z), args.spread)
+    except ValueError as e:
+        parser.error(str(e))
+
+    fake = None
+    if args.fake or args.serve_fake:
+        password = args.password or "fake"
+        fake = FakeMtui(args.user, password, args.fake_step, args.fake_error_rate, args.port,
+                        args.fake_admin_online)
+        fake.start()
+        if args.serve_fake:
+            print(f"Fake MTUI listening on {fake.url} (user={args.user}). Ctrl+C to stop.")
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+            fake.stop()
+            return 0
+        mtui_url = fake.url
+    else:
+        if not args.mtuiurl or not args.password:
+            parser.error("--mtuiurl and --password are required (or use --fake)")
+        mtui_url, password = args.mtuiurl, args.password
+
+    player_commands = [name for name in PLAYER_COMMANDS if name in mix.weights]
+    if player_commands:
+        logging.warning(f"Mix contains {', '.join('/' + n for n in player_commands)}: "
+                        f"these fail unless {args.user} is online in-game")
+
+    print(f"Load testing {mtui_url}: {args.rate}/s for {args.duration}s, "
+          f"{args.workers} sessions, mix={args.mix}")
+
+    tester = LoadTester(lambda: MtuiClient(mtui_url, args.user, password),
+                        mix, args.rate, args.duration, args.workers, args.stepinterval)
+    report = tester.run()
+
+    if fake:
+        fake.stop()
+
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report | {"mix": mix.weights, "url": mtui_url}, f, indent=2)
+        print(f"\nReport written to {args.report}")
+
+    if report["overall"]["count"] == 0:
+        logging.error("No commands completed (login failed?)")
+        return 1
+    if args.max_error_rate is not None and report["overall"]["error_rate"] > args.max_error_rate:
+        print(f"Error rate {report['overall']['error_rate']:.3f} exceeds {args.max_error_rate}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())